@@ -1,3 +1,5 @@
+import threading
+
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 
@@ -5,6 +7,12 @@ app = Flask(__name__)
 CORS(app, origins="*")
 
 from program_runner import run_program_with_input
+from process_mf import MaxFlowSession
+
+# Maximum flow session reused across requests while the selected cities stay the same, guarded by mf_session_lock
+# since the server handles requests in several threads
+mf_session = None
+mf_session_lock = threading.Lock()
 
 def generate_input_str(selected_cities, selected_routes):
     # Calculate the number of cities and flights
@@ -40,5 +48,47 @@ def process_data():
 
     return jsonify(response_data)
 
+@app.route('/api/route_sensitivity', methods=['POST'])
+def route_sensitivity():
+    data = request.get_json()
+    selected_cities = data.get('selectedCities', [])
+    selected_routes = data.get('selectedRoutes', [])
+
+    # Rank every route by the optimal travel route left after cancelling it
+    input_str = generate_input_str(selected_cities, selected_routes)
+    result = run_program_with_input(input_str, "process_sensitivity.py")
+
+    response_data = {'result': result}
+    print(response_data)
+
+    return jsonify(response_data)
+
+@app.route('/api/process_data_mf', methods=['POST'])
+def process_data_mf():
+    global mf_session
+    data = request.get_json()
+    selected_cities = data.get('selectedCities', [])
+    selected_routes = data.get('selectedRoutes', [])
+
+    with mf_session_lock:
+        try:
+            # Rebuild the graph only when the cities change, route edits are applied in place
+            if mf_session is None or mf_session.city_names[1:] != selected_cities:
+                mf_session = MaxFlowSession(selected_cities)
+
+            mf_session.sync_routes(selected_routes)
+            result = mf_session.result()
+        except KeyError:
+            mf_session = None
+            result = ["Invalid city name. Please enter valid city names."]
+        except Exception as e:
+            mf_session = None
+            result = [f"An unexpected error occurred: {e}"]
+
+    response_data = {'result': result}
+    print(response_data)
+
+    return jsonify(response_data)
+
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,82 @@
+"""
+Benchmark for the dynamic programming solution.
+
+Runs `process_dp.main` on random graphs with the plain transitions and with the bitmask transitions, checks that both
+produce identical output and prints the time taken by each.
+
+Usage: python benchmark_dp.py
+"""
+
+import io
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+import process_dp
+
+def generate_input_str(num_cities, density, seed=0):
+    """
+    Generate a random input for the solvers.
+
+    Parameters:
+    - num_cities: Number of cities in the graph.
+    - density: Probability that a direct flight route exists between two cities.
+    - seed: Seed of the random generator.
+
+    Returns:
+    - The input string in the format read by `process_dp.main`.
+    """
+    rng = random.Random(seed)
+    cities = [f"City{i}" for i in range(1, num_cities + 1)]
+    routes = [(cities[i], cities[j]) for i in range(num_cities) for j in range(i + 1, num_cities)
+              if rng.random() < density]
+
+    input_str = f"{num_cities} {len(routes)}\n"
+    input_str += "\n".join(cities) + "\n"
+    input_str += "".join(f"{city1} {city2}\n" for city1, city2 in routes)
+    return input_str
+
+def run_solver(input_str, use_bitset):
+    """
+    Run `process_dp.main` once on the given input.
+
+    Parameters:
+    - input_str: Input of the solver.
+    - use_bitset: Whether to use the bitmask transitions.
+
+    Returns:
+    - The output of the solver and the elapsed time in seconds.
+    """
+    process_dp.USE_BITSET = use_bitset
+    output = io.StringIO()
+    stdin = sys.stdin
+    sys.stdin = io.StringIO(input_str)
+    try:
+        start = time.perf_counter()
+        with redirect_stdout(output):
+            process_dp.main()
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdin = stdin
+    return output.getvalue(), elapsed
+
+def main():
+    sys.setrecursionlimit(10000)
+
+    print(f"{'cities':>6} {'density':>7} {'plain (s)':>10} {'bitset (s)':>10} {'speedup':>8}")
+    for num_cities in (25, 50, 100):
+        for density in (0.2, 0.5, 0.9):
+            input_str = generate_input_str(num_cities, density, seed=num_cities)
+            plain_output, plain_time = run_solver(input_str, False)
+            bitset_output, bitset_time = run_solver(input_str, True)
+
+            # Both transitions must produce the same route
+            if plain_output != bitset_output:
+                raise AssertionError(f"Outputs differ for {num_cities} cities with density {density}")
+
+            print(f"{num_cities:>6} {density:>7} {plain_time:>10.4f} {bitset_time:>10.4f} "
+                  f"{plain_time / bitset_time:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Equivalence check and benchmark for the maximum flow session.
+
+Applies random sequences of route insertions and deletions to a `process_mf.MaxFlowSession`, checks after every edit
+that its result matches a fresh run of `process_mf.main` and that the printed travel route is valid, then prints the
+time taken by the first synchronisation, by a fresh run and by incremental edits.
+
+Usage: python benchmark_mf.py
+"""
+
+import io
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+
+import process_mf
+
+def generate_input_str(cities, routes):
+    """
+    Generate the input of `process_mf.main` for the given cities and routes.
+
+    Parameters:
+    - cities: City names in order from west to east.
+    - routes: List of (city1, city2) pairs.
+
+    Returns:
+    - The input string.
+    """
+    input_str = f"{len(cities)} {len(routes)}\n"
+    input_str += "\n".join(cities) + "\n"
+    input_str += "".join(f"{city1} {city2}\n" for city1, city2 in routes)
+    return input_str
+
+def run_solver(cities, routes):
+    """
+    Run `process_mf.main` once from scratch.
+
+    Parameters:
+    - cities: City names in order from west to east.
+    - routes: List of (city1, city2) pairs.
+
+    Returns:
+    - The output of the solver as a list of lines and the elapsed time in seconds.
+    """
+    output = io.StringIO()
+    stdin = sys.stdin
+    sys.stdin = io.StringIO(generate_input_str(cities, routes))
+    try:
+        start = time.perf_counter()
+        with redirect_stdout(output):
+            process_mf.main()
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdin = stdin
+    return output.getvalue().splitlines(), elapsed
+
+def check_route(cities, routes, lines):
+    """
+    Check that the output of a session describes a valid travel route.
+
+    Parameters:
+    - cities: City names in order from west to east.
+    - routes: List of active (city1, city2) pairs.
+    - lines: Output of `MaxFlowSession.result`.
+    """
+    if lines == ["No Solution!"]:
+        return
+
+    tour = lines[1:]
+    active = {frozenset(route) for route in routes}
+
+    # The route starts and ends at the first city, visits the last city and no other city twice
+    assert tour[0] == tour[-1] == cities[0], tour
+    assert cities[-1] in tour, tour
+    assert len(set(tour[:-1])) == len(tour) - 1 or int(lines[0]) == 2, tour
+    assert int(lines[0]) == len(tour) - 1, lines
+
+    for city1, city2 in zip(tour, tour[1:]):
+        assert frozenset((city1, city2)) in active, (city1, city2)
+
+def check_equivalence(trials, steps, seed=0):
+    """
+    Compare a session with fresh runs of `process_mf.main` on random edit sequences.
+
+    Parameters:
+    - trials: Number of random city lists.
+    - steps: Number of edits applied to each session.
+    - seed: Seed of the random generator.
+    """
+    rng = random.Random(seed)
+    for _ in range(trials):
+        num_cities = rng.randint(2, 10)
+        cities = [f"City{i}" for i in range(1, num_cities + 1)]
+        pairs = [(cities[i], cities[j]) for i in range(num_cities) for j in range(i + 1, num_cities)]
+        session = process_mf.MaxFlowSession(cities)
+        routes = []
+
+        for _ in range(steps):
+            choice = rng.random()
+            if routes and choice < 0.3:
+                # Delete one route
+                route = rng.choice(routes)
+                routes.remove(route)
+                session.remove_route(*route)
+            elif choice < 0.8 or not routes:
+                # Insert one route, in either direction
+                candidates = [pair for pair in pairs if pair not in routes]
+                if not candidates:
+                    continue
+                route = rng.choice(candidates)
+                routes.append(route)
+                session.add_route(*(route if rng.random() < 0.5 else route[::-1]))
+            else:
+                # Replace a random subset of the routes at once
+                routes = [pair for pair in pairs if rng.random() < 0.5]
+                session.sync_routes(routes)
+
+            lines = session.result()
+            expected, _ = run_solver(cities, routes)
+            if lines[0] != expected[0]:
+                raise AssertionError(f"Session printed {lines[0]}, expected {expected[0]} for {routes}")
+            check_route(cities, routes, lines)
+
+def main():
+    sys.setrecursionlimit(10000)
+
+    check_equivalence(trials=100, steps=15)
+    print("Session matches process_mf.main on random edit sequences")
+
+    print(f"{'cities':>6} {'density':>7} {'fresh (s)':>10} {'sync (s)':>10} {'edit (s)':>10}")
+    for num_cities in (25, 50, 100):
+        for density in (0.3, 0.8):
+            rng = random.Random(num_cities)
+            cities = [f"City{i}" for i in range(1, num_cities + 1)]
+            routes = [(cities[i], cities[j]) for i in range(num_cities) for j in range(i + 1, num_cities)
+                      if rng.random() < density]
+
+            _, fresh_time = run_solver(cities, routes)
+
+            start = time.perf_counter()
+            session = process_mf.MaxFlowSession(cities)
+            session.sync_routes(routes)
+            sync_time = time.perf_counter() - start
+
+            # Delete and insert back a few routes of the current travel route
+            lines = session.result()
+            tour = lines[1:]
+            start = time.perf_counter()
+            for city1, city2 in list(zip(tour, tour[1:]))[:5]:
+                session.remove_route(city1, city2)
+                session.add_route(city1, city2)
+            edit_time = (time.perf_counter() - start) / 10
+
+            print(f"{num_cities:>6} {density:>7} {fresh_time:>10.4f} {sync_time:>10.4f} {edit_time:>10.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -78,6 +78,12 @@ Constants:
 INF = float('inf')
 N = 103
 
+"""
+- USE_BITSET: Use the big-int bitmask transitions instead of scanning every lower-indexed city. Both paths produce
+  identical output, the bitmask path only visits real predecessors.
+"""
+USE_BITSET = True
+
 def find_optimal_routes(x, y):
     """
     Find the optimal number of routes from city x to city y using dynamic programming.
@@ -124,6 +130,152 @@ def find_optimal_routes(x, y):
     # Return the dynamic programming value for the current point
     return dp[x][y]
 
+"""
+- road_masks: road_masks[x] is an integer bitmask with bit i set when there is a road between city i and city x, i < x.
+- solved_masks: solved_masks[x] has bit i set once the state (i, x) has been visited by `find_optimal_routes_bitset`.
+- value_masks: value_masks[x][v] is the bitmask of cities i whose visited state (i, x) can reach the start with value v.
+- row_max: row_max[x] is the largest value stored in value_masks[x], or -1 if there is none.
+- dp_value_masks: Cache mapping a row of the finished dp table to a dict of {dp value: bitmask of columns}.
+"""
+road_masks = []
+solved_masks = []
+value_masks = []
+row_max = []
+dp_value_masks = {}
+
+def build_bitset_tables():
+    """
+    Build the lower-indexed neighbour bitmask of every city from the `road` matrix and reset the tables used by
+    `find_optimal_routes_bitset`.
+
+    Note: This function assumes global variables `n` and `road`.
+    """
+    global road_masks, solved_masks, value_masks, row_max
+
+    road_masks = [0] * (n + 1)
+    for x in range(n + 1):
+        mask = 0
+        for i in range(x):
+            if road[i][x]:
+                mask |= 1 << i
+        road_masks[x] = mask
+
+    solved_masks = [0] * (n + 1)
+    value_masks = [{} for _ in range(n + 1)]
+    row_max = [-1] * (n + 1)
+
+def mark_solved(x, y, value):
+    """
+    Record a visited state in the bitmask tables of both of its rows.
+
+    Parameters:
+    - x: City index for the first traveler.
+    - y: City index for the second traveler.
+    - value: Value of the state, or None if the state cannot reach the starting point.
+    """
+    solved_masks[y] |= 1 << x
+    solved_masks[x] |= 1 << y
+
+    if value is None:
+        return
+
+    for row, column in ((y, x), (x, y)):
+        value_masks[row][value] = value_masks[row].get(value, 0) | (1 << column)
+        row_max[row] = max(row_max[row], value)
+
+def best_solved_value(row, predecessors, floor):
+    """
+    Find the largest value among the visited states (i, row) for the cities i in the given bitmask.
+
+    Parameters:
+    - row: City index shared by the states.
+    - predecessors: Bitmask of the cities i to consider, all of them already visited.
+    - floor: Value to return when no state is larger.
+
+    Returns:
+    - The largest value above floor, or floor.
+    """
+    groups = value_masks[row]
+
+    # Test one group of equal values at a time, from the largest value down
+    for value in range(row_max[row], floor, -1):
+        if groups.get(value, 0) & predecessors:
+            return value
+
+    return floor
+
+def group_by_dp_value(row):
+    """
+    Group the columns of a row of the finished dp table by their value.
+
+    Parameters:
+    - row: City index of the row.
+
+    Returns:
+    - A dict mapping each dp value in the row to the bitmask of columns holding it.
+    """
+    groups = dp_value_masks.get(row)
+    if groups is None:
+        groups = {}
+        for i, value in enumerate(dp[row]):
+            groups[value] = groups.get(value, 0) | (1 << i)
+        dp_value_masks[row] = groups
+    return groups
+
+def find_optimal_routes_bitset(x, y):
+    """
+    Bitmask variant of `find_optimal_routes` that fills the same dp table.
+
+    Only the cities with a road to x or y are visited, each state is solved at most once, and the best predecessor is
+    picked by testing groups of equal values against the predecessor bitmask instead of one city at a time.
+
+    Parameters:
+    - x: Current city index for the first traveler.
+    - y: Current city index for the second traveler.
+
+    Returns:
+    - The optimal number of routes from city x to city y.
+
+    Note: This function assumes global variables `dp`, `road_masks`, `solved_masks`, `value_masks` and `row_max`.
+    """
+    # Check if the dynamic programming value for the current point is already calculated
+    if dp[x][y]:
+        return dp[x][y]
+
+    # Check if the sum of x and y is 1 (reached the starting point)
+    if x + y == 1:
+        mark_solved(x, y, 0)
+        return 0
+
+    # Keep only the predecessors below min(x, y)
+    below = (1 << min(x, y)) - 1
+    via_x = road_masks[x] & below
+    via_y = road_masks[y] & below
+
+    # Solve the states (i, y) that have not been visited yet, lowest index first
+    pending = via_x & ~solved_masks[y]
+    while pending:
+        find_optimal_routes_bitset((pending & -pending).bit_length() - 1, y)
+        pending = via_x & ~solved_masks[y]
+
+    # Solve the states (i, x) that have not been visited yet, lowest index first
+    pending = via_y & ~solved_masks[x]
+    while pending:
+        find_optimal_routes_bitset((pending & -pending).bit_length() - 1, x)
+        pending = via_y & ~solved_masks[x]
+
+    best = best_solved_value(y, via_x, -1)
+    best = best_solved_value(x, via_y, best)
+
+    # Check if no predecessor can reach the starting point
+    if best < 0:
+        mark_solved(x, y, None)
+        return -INF
+
+    dp[y][x] = dp[x][y] = best + 1
+    mark_solved(x, y, best + 1)
+    return best + 1
+
 """
 - total_points: Total number of points visited during the route optimization process
 - points_from_x: List to store points reachable from the current city for the first traveler.
@@ -178,8 +330,44 @@ def find_solution(x, y):
             find_solution(x, i)
             return
 
+def find_solution_bitset(x, y):
+    """
+    Bitmask variant of `find_solution` that picks the next point among the predecessors with the expected dp value.
+
+    Parameters:
+    - x: Current city index for the first traveler.
+    - y: Current city index for the second traveler.
+    """
+    global total_points
+
+    # Increase the total_points count and store the current point
+    total_points += 1
+    points_from_x[total_points] = x
+    points_from_y[total_points] = y
+
+    # Check if the sum of x and y is 1 (reached the starting point)
+    if x + y == 1:
+        return
+
+    below = (1 << min(x, y)) - 1
+    target = dp[x][y] - 1
+
+    # Predecessors of x whose state with y holds the target value, and the same for y with x
+    via_x = road_masks[x] & group_by_dp_value(y).get(target, 0) & below
+    via_y = road_masks[y] & group_by_dp_value(x).get(target, 0) & below
+
+    # Take the lowest index, preferring the first traveler on a tie, as `find_solution` does
+    candidates = via_x | via_y
+    if candidates:
+        lowest = candidates & -candidates
+        i = lowest.bit_length() - 1
+        if via_x & lowest:
+            find_solution_bitset(i, y)
+        else:
+            find_solution_bitset(x, i)
+
 def main():
-    global n, m, cities, city_indices, road, dp, points_from_x, points_from_y
+    global n, m, cities, city_indices, road, dp, total_points, points_from_x, points_from_y, dp_value_masks
 
     try:
         # Read input values for the number of cities (n) and the number of flights (m)
@@ -206,7 +394,17 @@ def main():
             elif y == 1:
                 road[0][x] = road[x][0] = 1
 
-        find_optimal_routes(n, n)
+        # Reset the state of a previous run
+        total_points = 0
+        points_from_x = [0] * (N * N)
+        points_from_y = [0] * (N * N)
+        dp_value_masks = {}
+
+        if USE_BITSET:
+            build_bitset_tables()
+            find_optimal_routes_bitset(n, n)
+        else:
+            find_optimal_routes(n, n)
 
         # Check if there is a valid solution, if not, print an error message and return
         if not dp[n][n]:
@@ -219,7 +417,10 @@ def main():
         for i in range(1, n):
             # Check if the current position has a value one less than the maximum in the last column
             if dp[i][n] == dp[n][n] - 1:
-                find_solution(i, n)
+                if USE_BITSET:
+                    find_solution_bitset(i, n)
+                else:
+                    find_solution(i, n)
                 break
 
         # Remove duplicates from the list of points_from_x and sort it
@@ -6,6 +6,9 @@ negative weights. The graph represents a city network with direct flights and co
 maximum cost flow is calculated considering the given constraints, and the optimal route is determined using depth-first
 search (DFS) in two rounds.
 
+`MaxFlowSession` keeps the residual graph alive between requests, so that route insertions and deletions are applied in
+place and the optimal flow is repaired locally instead of being recomputed from zero flow.
+
 (1) Input Format:
 The first line of input consists of two integers separated by a space, representing the number of vertices in the
 airline graph (n) and the number of edges (m).
@@ -269,6 +272,512 @@ def dfs_second_round(current):
     # Print the city name associated with the current node (second round)
     print(city_names[current - n])
 
+class MaxFlowSession:
+    """
+    Stateful maximum cost flow over the split-node graph, kept alive across route edits.
+
+    The graph is built once for a fixed list of cities. Routes are then inserted and deleted in place on the residual
+    graph, and optimality is restored locally instead of re-running the Edmonds-Karp algorithm from zero flow:
+    - Inserting a route keeps the current flow feasible, so only positive cycles through the new edge are cancelled,
+      followed by an augmentation if the flow is still below 2.
+    - Deleting an unused route keeps the current flow optimal and needs no work.
+    - Deleting a route on the current tour withdraws the single unit of flow crossing it, cancels any positive cycles
+      and re-augments once.
+    - Loading many routes at once, as for a fresh session, solves again from zero flow.
+
+    Attributes:
+    - n (int): Number of cities.
+    - city_names (list): City names indexed from 1, in order from west to east.
+    - city_mapping (dict): Maps a city name to its index.
+    - routes (set): Active routes as (x, y) index pairs with x < y.
+    - max_flow (int): Current flow value from the source to the sink.
+    - max_cost (int): Current total cost of the flow.
+    """
+
+    # Number of route edits above which `sync_routes` solves again from zero flow
+    RESOLVE_THRESHOLD = 8
+
+    def __init__(self, city_names):
+        """
+        Builds the split-node graph for the given cities with no routes.
+
+        Parameters:
+        - city_names (list): City names in order from west to east.
+        """
+        self.n = len(city_names)
+        self.city_names = [""] + list(city_names)
+        self.city_mapping = {self.city_names[i]: i for i in range(1, self.n + 1)}
+        self.source = 1
+        self.sink = self.n * 2
+        self.edge_index = 1
+        self.flow_edges = [FlowEdge(0, 0, 0, 0), FlowEdge(0, 0, 0, 0)]
+        self.head = [0] * (self.sink + 1)
+        self.route_edges = {}
+        self.routes = set()
+        self.max_flow = 0
+        self.max_cost = 0
+
+        # Without cities there is no graph to build, `result` reports no solution
+        n = self.n
+        if n < 1:
+            return
+
+        for i in range(2, n):
+            self.add_directed_edge(i, n + i, 1, 1)
+
+        self.add_directed_edge(1, 1 + n, 2, 1)
+        self.add_directed_edge(n, n + n, 2, 1)
+
+    def add_edge(self, start, end, capacity, weight):
+        """
+        Add an edge to the residual graph of the session.
+
+        Parameters:
+        - start: Starting vertex of the edge.
+        - end: Ending vertex of the edge.
+        - capacity: Capacity of the edge.
+        - weight: Weight or cost associated with the edge.
+        """
+        self.edge_index += 1
+        self.flow_edges.append(FlowEdge(weight, end, self.head[start], capacity))
+        self.head[start] = self.edge_index
+
+    def add_directed_edge(self, a, b, flow, weight):
+        """
+        Add a directed edge and its reverse edge to the residual graph of the session.
+
+        Parameters:
+        - a: Starting vertex of the directed edge.
+        - b: Ending vertex of the directed edge.
+        - flow: Capacity of the directed edge.
+        - weight: Weight or cost associated with the directed edge.
+        """
+        # Add the edge from a to b
+        self.add_edge(a, b, flow, weight)
+
+        # Add the reverse edge from b to a with capacity 0 and negative weight
+        self.add_edge(b, a, 0, -weight)
+
+    def route_key(self, city1, city2):
+        """
+        Converts a pair of city names into the (x, y) index pair used for routes.
+
+        Parameters:
+        - city1: Name of the first city.
+        - city2: Name of the second city.
+
+        Returns:
+        - The city indices ordered from west to east.
+
+        Raises:
+        - KeyError: If either city is not part of the session.
+        """
+        x = self.city_mapping[city1]
+        y = self.city_mapping[city2]
+
+        if x > y:
+            x, y = y, x
+
+        return x, y
+
+    def insert_route_edge(self, x, y):
+        """
+        Gives the route (x, y) its capacity back in the residual graph, without touching the flow.
+
+        Parameters:
+        - x: Index of the western city of the route.
+        - y: Index of the eastern city of the route.
+
+        Returns:
+        - True if the route was inserted, False if it was already active or goes from a city to itself.
+        """
+        # Ignore routes that are already active and routes from a city to itself
+        if (x, y) in self.routes or x == y:
+            return False
+
+        edge = self.route_edges.get((x, y))
+        if edge is None:
+            # First insertion of this route, add a new edge to the graph
+            self.add_directed_edge(x + self.n, y, 1, 0)
+            edge = self.edge_index - 1
+            self.route_edges[(x, y)] = edge
+        else:
+            # The route was deleted earlier, restore the capacity of its edge
+            self.flow_edges[edge].flow = 1
+            self.flow_edges[edge ^ 1].flow = 0
+
+        self.routes.add((x, y))
+        return True
+
+    def delete_route_edge(self, x, y, withdraw=True):
+        """
+        Removes the capacity of the route (x, y) from the residual graph.
+
+        Parameters:
+        - x: Index of the western city of the route.
+        - y: Index of the eastern city of the route.
+        - withdraw: Whether to withdraw the unit of flow crossing the route, so that the remaining flow stays feasible.
+
+        Returns:
+        - True if the route carried flow, False otherwise.
+        """
+        if (x, y) not in self.routes:
+            return False
+
+        self.routes.remove((x, y))
+        edge = self.route_edges[(x, y)]
+
+        # Check if the route lies on the current tour
+        carried_flow = self.flow_edges[edge ^ 1].flow > 0
+        if carried_flow and withdraw:
+            self.withdraw_path(edge)
+
+        self.flow_edges[edge].flow = self.flow_edges[edge ^ 1].flow = 0
+        return carried_flow
+
+    def add_route(self, city1, city2):
+        """
+        Inserts a direct flight route and restores the optimal flow.
+
+        Parameters:
+        - city1: Name of the first city.
+        - city2: Name of the second city.
+        """
+        # The current flow is still feasible, only cycles through the new edge can improve it
+        if self.insert_route_edge(*self.route_key(city1, city2)):
+            self.cancel_positive_cycles()
+            self.augment()
+
+    def remove_route(self, city1, city2):
+        """
+        Deletes a direct flight route and restores the optimal flow.
+
+        Parameters:
+        - city1: Name of the first city.
+        - city2: Name of the second city.
+        """
+        # An unused route does not carry flow, the current flow stays optimal
+        if self.delete_route_edge(*self.route_key(city1, city2)):
+            self.cancel_positive_cycles()
+            self.augment()
+
+    def sync_routes(self, routes):
+        """
+        Applies the difference between the active routes and the given routes.
+
+        Small differences are applied in place and repaired with a single round of cycle cancelling and augmentation.
+        A fresh session, or a difference larger than RESOLVE_THRESHOLD routes, is solved again from zero flow instead,
+        which is much cheaper than cancelling cycles after many edits.
+
+        Parameters:
+        - routes: Iterable of (city1, city2) pairs describing all routes that should be active.
+        """
+        wanted = {self.route_key(city1, city2) for city1, city2 in routes}
+        removed = sorted(self.routes - wanted)
+        added = sorted(wanted - self.routes)
+
+        if not removed and not added:
+            return
+
+        resolve = not self.routes or len(removed) + len(added) > self.RESOLVE_THRESHOLD
+
+        # Delete routes first so that their edges can be reused by later insertions
+        repaired = False
+        for x, y in removed:
+            repaired |= self.delete_route_edge(x, y, withdraw=not resolve)
+
+        inserted = False
+        for x, y in added:
+            inserted |= self.insert_route_edge(x, y)
+
+        if resolve:
+            self.reset_flow()
+        elif repaired or inserted:
+            self.cancel_positive_cycles()
+        else:
+            return
+
+        self.augment()
+
+    def reset_flow(self):
+        """
+        Returns every edge to zero flow, keeping the capacities of the active routes.
+        """
+        for edge_index in range(2, self.edge_index + 1, 2):
+            self.flow_edges[edge_index].flow += self.flow_edges[edge_index ^ 1].flow
+            self.flow_edges[edge_index ^ 1].flow = 0
+
+        self.max_flow = 0
+        self.max_cost = 0
+
+    def withdraw_path(self, edge):
+        """
+        Removes the unit of flow that crosses the given edge along its whole path from the source to the sink.
+
+        Parameters:
+        - edge: Index of a forward edge carrying one unit of flow.
+        """
+        flow_edges = self.flow_edges
+        cost = flow_edges[edge].weight
+        flow_edges[edge].flow += 1
+        flow_edges[edge ^ 1].flow -= 1
+
+        # Follow forward edges carrying flow from the head of the edge to the sink
+        current = flow_edges[edge].destination
+        while current != self.sink:
+            edge_index = self.head[current]
+            while edge_index & 1 or not flow_edges[edge_index ^ 1].flow:
+                edge_index = flow_edges[edge_index].next_edge
+
+            flow_edges[edge_index].flow += 1
+            flow_edges[edge_index ^ 1].flow -= 1
+            cost += flow_edges[edge_index].weight
+            current = flow_edges[edge_index].destination
+
+        # Follow reverse edges with residual capacity from the tail of the edge back to the source
+        current = flow_edges[edge ^ 1].destination
+        while current != self.source:
+            edge_index = self.head[current]
+            while not edge_index & 1 or not flow_edges[edge_index].flow:
+                edge_index = flow_edges[edge_index].next_edge
+
+            flow_edges[edge_index].flow -= 1
+            flow_edges[edge_index ^ 1].flow += 1
+            cost += flow_edges[edge_index ^ 1].weight
+            current = flow_edges[edge_index].destination
+
+        self.max_flow -= 1
+        self.max_cost -= cost
+
+    def find_positive_cycle(self):
+        """
+        Bellman-Ford search for a positive cost cycle in the residual graph.
+
+        Returns:
+        - The edge indices of a positive cycle, or an empty list if there is none.
+        """
+        flow_edges = self.flow_edges
+        vertices = self.sink
+
+        # Every vertex starts at distance 0, as if reached from a virtual source
+        distances = [0] * (vertices + 1)
+        predecessors = [0] * (vertices + 1)
+
+        # Visit the vertices from west to east, so that the forward edges settle in a single round and only the
+        # reverse edges of the flow paths need more rounds
+        order = [vertex for i in range(1, self.n + 1) for vertex in (i, self.n + i)]
+
+        for _ in range(vertices):
+            relaxed = False
+            for current in order:
+                edge_index = self.head[current]
+                while edge_index:
+                    edge = flow_edges[edge_index]
+                    if edge.flow and distances[edge.destination] < distances[current] + edge.weight:
+                        distances[edge.destination] = distances[current] + edge.weight
+                        predecessors[edge.destination] = edge_index
+                        relaxed = True
+                    edge_index = edge.next_edge
+
+            if not relaxed:
+                return []
+
+            # A cycle in the predecessor graph is always a positive cycle, look for one after every round
+            cycle = self.find_predecessor_cycle(predecessors)
+            if cycle:
+                return cycle
+
+        return []
+
+    def find_predecessor_cycle(self, predecessors):
+        """
+        Looks for a cycle in the graph formed by the predecessor edges of a Bellman-Ford search.
+
+        Parameters:
+        - predecessors: Index of the last edge that relaxed each vertex, or 0.
+
+        Returns:
+        - The edge indices of the cycle, or an empty list if there is none.
+        """
+        flow_edges = self.flow_edges
+        walked = [0] * (self.sink + 1)
+
+        for start in range(1, self.sink + 1):
+            # Follow the predecessor edges back until reaching a vertex that was already walked
+            current = start
+            while not walked[current] and predecessors[current]:
+                walked[current] = start
+                current = flow_edges[predecessors[current] ^ 1].destination
+
+            # Reaching a vertex of the same walk closes a cycle
+            if walked[current] == start:
+                cycle = []
+                last = current
+                while True:
+                    edge_index = predecessors[current]
+                    cycle.append(edge_index)
+                    current = flow_edges[edge_index ^ 1].destination
+                    if current == last:
+                        return cycle
+
+        return []
+
+    def cancel_positive_cycles(self):
+        """
+        Pushes flow around positive cycles of the residual graph until none are left.
+        """
+        while True:
+            cycle = self.find_positive_cycle()
+            if not cycle:
+                return
+
+            amount = min(self.flow_edges[edge_index].flow for edge_index in cycle)
+            for edge_index in cycle:
+                self.flow_edges[edge_index].flow -= amount
+                self.flow_edges[edge_index ^ 1].flow += amount
+                self.max_cost += amount * self.flow_edges[edge_index].weight
+
+    def spfa(self):
+        """
+        SPFA (Shortest Path Faster Algorithm) for finding the longest augmenting path in the residual graph.
+
+        Returns:
+        - The lists of distances, predecessor edges and minimum residual flow, or None if the sink is unreachable.
+        """
+        flow_edges = self.flow_edges
+        distances = [-INF] * (self.sink + 1)
+        in_queue = [0] * (self.sink + 1)
+        min_residual_flow = [0] * (self.sink + 1)
+        predecessors = [0] * (self.sink + 1)
+
+        queue = deque()
+        queue.append(self.source)
+        in_queue[self.source] = 1
+        distances[self.source] = 0
+        min_residual_flow[self.source] = INF
+
+        while queue:
+            current = queue.popleft()
+            in_queue[current] = 0
+
+            # Iterate through outgoing edges from the current vertex
+            edge_index = self.head[current]
+            while edge_index:
+                edge = flow_edges[edge_index]
+
+                # Relaxation step
+                if edge.flow and distances[edge.destination] < distances[current] + edge.weight:
+                    distances[edge.destination] = distances[current] + edge.weight
+                    predecessors[edge.destination] = edge_index
+                    min_residual_flow[edge.destination] = min(min_residual_flow[current], edge.flow)
+
+                    # Enqueue the destination vertex if not in the queue
+                    if not in_queue[edge.destination]:
+                        in_queue[edge.destination] = 1
+                        queue.append(edge.destination)
+
+                edge_index = edge.next_edge
+
+        if distances[self.sink] == -INF:
+            return None
+
+        return distances, predecessors, min_residual_flow
+
+    def augment(self):
+        """
+        Augments along longest paths until the sink is unreachable, starting from the current flow.
+        """
+        while True:
+            path = self.spfa()
+            if path is None:
+                return
+
+            distances, predecessors, min_residual_flow = path
+            amount = min_residual_flow[self.sink]
+
+            # Update max flow and cost along the augmenting path
+            self.max_flow += amount
+            self.max_cost += amount * distances[self.sink]
+
+            # Update flow along the augmenting path
+            current = self.sink
+            while current != self.source:
+                edge_index = predecessors[current]
+                self.flow_edges[edge_index].flow -= amount
+                self.flow_edges[edge_index ^ 1].flow += amount
+                current = self.flow_edges[edge_index ^ 1].destination
+
+    def result(self):
+        """
+        Builds the output of the current optimal route, in the same format as `main`.
+
+        Returns:
+        - The output as a list of lines.
+        """
+        n = self.n
+
+        if n < 1:
+            return ["No Solution!"]
+        elif self.max_flow == 2:
+            lines = [str(self.max_cost - 2)]
+        elif self.max_flow == 1 and (1, n) in self.routes:
+            return ["2", self.city_names[1], self.city_names[n], self.city_names[1]]
+        else:
+            return ["No Solution!"]
+
+        visited = [0] * (self.sink + 1)
+        self.dfs_first_round(1 + n, visited, lines)
+        self.dfs_second_round(1 + n, visited, lines)
+
+        return lines
+
+    def next_cities(self, current):
+        """
+        Yields the cities reached from the given vertex by routes that carry flow.
+
+        Parameters:
+        - current: Vertex on the outgoing side of a city.
+        """
+        edge_index = self.head[current]
+        while edge_index:
+            # Only forward route edges are taken, deleted routes carry no flow in either direction
+            if not edge_index & 1 and self.flow_edges[edge_index ^ 1].flow:
+                destination = self.flow_edges[edge_index].destination
+                if destination <= self.n:
+                    yield destination
+            edge_index = self.flow_edges[edge_index].next_edge
+
+    def dfs_first_round(self, current, visited, lines):
+        """
+        DFS traversal in the first round to find the cities in the optimal route.
+
+        Parameters:
+        - current: Current vertex in the traversal.
+        - visited: List of visited flags per vertex.
+        - lines: List collecting the output lines.
+        """
+        visited[current] = 1
+        lines.append(self.city_names[current - self.n])
+
+        for destination in self.next_cities(current):
+            self.dfs_first_round(destination + self.n, visited, lines)
+            break
+
+    def dfs_second_round(self, current, visited, lines):
+        """
+        DFS traversal in the second round to find the cities in the optimal route.
+
+        Parameters:
+        - current: Current vertex in the traversal.
+        - visited: List of visited flags per vertex.
+        - lines: List collecting the output lines.
+        """
+        for destination in self.next_cities(current):
+            if not visited[destination + self.n]:
+                self.dfs_second_round(destination + self.n, visited, lines)
+
+        lines.append(self.city_names[current - self.n])
+
 def main():
     global n, m, source, sink, flow_edges, head, distances, visited, predecessors, min_residual_flow, max_cost, max_flow, flag, city_names, city_mapping, edge_index
 
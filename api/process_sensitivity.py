@@ -0,0 +1,283 @@
+"""
+Route-Closure Sensitivity Analysis for Air Canada Travel Routes
+
+For every direct flight route, this program computes the length of the optimal travel route (as found by
+process_dp.py) when that route is cancelled, and ranks the routes by how much the optimal travel route suffers.
+
+The travel route is the same two-traveler dynamic programming problem as in process_dp.py: a state (x, y) means the
+two travelers stand at cities x and y, and a transition moves the traveler at the smaller index i to a city beyond
+max(i, y) along the route (i, x). Every transition increases min(x, y), so for any city u the transitions that use a
+route (u, v) all leave the states of level min(x, y) <= u and enter the states of level > u, and every travel route
+makes exactly one such step. The best travel route without (u, v) is therefore the best step across level u that
+does not use (u, v), scored as forward[i][y] + 1 + backward[x][y], where:
+- forward[x][y] is the best value of reaching the state (x, y) from the starting city (the table of process_dp.py).
+- backward[x][y] is the best value of finishing the travel route from the state (x, y).
+
+Both tables are computed once. The best step into each state (x, y) is then maintained in a single sweep over the
+levels, and a route is only re-evaluated if it lies on the current optimal travel route, since cancelling any other
+route leaves that travel route in place. The tables and the sweep take O(n^3) time and each route of the optimal
+travel route takes O(n^2) more, so the whole analysis costs O(n^3), independent of the number of routes m, instead of
+one run of the dynamic programming solution per route.
+
+(1) Input Format:
+Same as process_dp.py.
+
+(2) Output Format:
+
+If a route exists, the output format is as follows:
+
+Output an integer k on the first line, representing the maximum number of cities in the route.
+
+Each of the following lines contains two strings and the result of cancelling that route, separated by spaces: the
+names of the two cities of the route, then the maximum number of cities in the route without it, or "No Solution!" if
+no route remains. There is one line per distinct route, so a route given more than once in the input is only listed
+once, with the city names of its first occurrence. The lines are ranked from the most critical route to the least
+critical one, routes with the same result keep their input order.
+
+If no solution exists, output the string "No Solution!" on a single line.
+
+(3) Sample Input:
+
+8 9
+Vancouver
+Yellowknife
+Edmonton
+Calgary
+Winnipeg
+Toronto
+Montreal
+Halifax
+Vancouver Edmonton
+Vancouver Calgary
+Calgary Winnipeg
+Winnipeg Toronto
+Toronto Halifax
+Montreal Halifax
+Edmonton Montreal
+Edmonton Yellowknife
+Edmonton Calgary
+
+(4) Sample Output:
+
+7
+Vancouver Edmonton No Solution!
+Vancouver Calgary No Solution!
+Calgary Winnipeg No Solution!
+Winnipeg Toronto No Solution!
+Toronto Halifax No Solution!
+Montreal Halifax No Solution!
+Edmonton Montreal No Solution!
+Edmonton Yellowknife 7
+Edmonton Calgary 7
+
+"""
+
+"""
+Constants:
+- INF: Represents infinity in the context of the algorithm.
+"""
+INF = float('inf')
+
+def build_forward_table(n, road):
+    """
+    Compute the best value of reaching every state from the starting city.
+
+    Parameters:
+    - n: Number of cities.
+    - road: Adjacency matrix, where city 1 is also available as index 0 for the second traveler.
+
+    Returns:
+    - The table forward, where forward[x][y] is the value of the state (x, y), or -INF if it cannot be reached.
+    """
+    forward = [[-INF] * (n + 1) for _ in range(n + 1)]
+
+    # Both travelers start from city 1
+    forward[0][1] = forward[1][0] = 0
+
+    # A state (x, y) only depends on states with a smaller max(x, y), or the same max(x, y) and a smaller min(x, y)
+    for high in range(2, n + 1):
+        for low in range(high + 1):
+            best = -INF
+            for i in range(low):
+                if road[i][high]:
+                    best = max(best, forward[i][low] + 1)
+                if road[i][low]:
+                    best = max(best, forward[i][high] + 1)
+            forward[low][high] = forward[high][low] = best
+
+    return forward
+
+def build_backward_table(n, road):
+    """
+    Compute the best value of finishing the travel route from every state.
+
+    Parameters:
+    - n: Number of cities.
+    - road: Adjacency matrix, where city 1 is also available as index 0 for the second traveler.
+
+    Returns:
+    - The table backward, where backward[x][y] is the value still to be collected from the state (x, y) until both
+      travelers meet at city n, or -INF if they cannot.
+    """
+    backward = [[-INF] * (n + 1) for _ in range(n + 1)]
+    backward[n][n] = 0
+
+    # Only the traveler at the smaller index moves, and it always moves beyond it
+    for low in range(n - 1, -1, -1):
+        for high in range(low + 1, n + 1):
+            best = -INF
+            for x in range(low + 1, n + 1):
+                if road[low][x]:
+                    best = max(best, backward[min(x, high)][max(x, high)] + 1)
+            backward[low][high] = backward[high][low] = best
+
+    return backward
+
+def find_tour_routes(n, road, forward):
+    """
+    Backtrack one optimal travel route through the forward table.
+
+    Parameters:
+    - n: Number of cities.
+    - road: Adjacency matrix, where city 1 is also available as index 0 for the second traveler.
+    - forward: Table returned by `build_forward_table`.
+
+    Returns:
+    - The set of routes (x, y), x < y, used by the travel route.
+    """
+    routes = set()
+    x, y = n, n
+
+    # Walk back until both travelers are at the starting city
+    while x + y != 1:
+        target = forward[x][y] - 1
+        for i in range(min(x, y)):
+            if road[i][x] and forward[i][y] == target:
+                routes.add((max(i, 1), x))
+                x = i
+                break
+            if road[i][y] and forward[i][x] == target:
+                routes.add((max(i, 1), y))
+                y = i
+                break
+
+    return routes
+
+def find_closure_lengths(n, road, forward, backward, tour_routes):
+    """
+    Compute the value of the optimal travel route without each route of the current optimal travel route.
+
+    Parameters:
+    - n: Number of cities.
+    - road: Adjacency matrix, where city 1 is also available as index 0 for the second traveler.
+    - forward: Table returned by `build_forward_table`.
+    - backward: Table returned by `build_backward_table`.
+    - tour_routes: Routes (u, v), u < v, of the current optimal travel route.
+
+    Returns:
+    - A dict mapping each route of tour_routes to the value without it, or -INF if no travel route remains.
+    """
+    lengths = {}
+
+    # The two travelers leave city 1 along two of its routes and continue from the state (a, b)
+    neighbours = [a for a in range(2, n + 1) if road[1][a]]
+    for u, v in tour_routes:
+        if u == 1:
+            best = -INF
+            for a in neighbours:
+                for b in neighbours:
+                    if a != v and b != v:
+                        best = max(best, backward[a][b] + 2)
+            lengths[(u, v)] = best
+
+    # Group the remaining routes by the level they leave from
+    cuts = {}
+    for u, v in tour_routes:
+        if u > 1:
+            cuts.setdefault(u, []).append(v)
+
+    # best_step[x][y] is the best forward[i][y] over the cities i already swept with a route (i, x)
+    best_step = [[-INF] * (n + 1) for _ in range(n + 1)]
+
+    for level in range(n):
+        # Keep the steps into city v that do not use the route (level, v)
+        without = {v: best_step[v][:] for v in cuts.get(level, [])}
+
+        # Add the steps leaving from the traveler at city level
+        for x in range(level + 1, n + 1):
+            if road[level][x]:
+                row = best_step[x]
+                for y in range(level + 1, n + 1):
+                    if forward[level][y] > row[y]:
+                        row[y] = forward[level][y]
+
+        # Every travel route steps across this level exactly once
+        for v, row_without in without.items():
+            best = -INF
+            for x in range(level + 1, n + 1):
+                row = row_without if x == v else best_step[x]
+                for y in range(level + 1, n + 1):
+                    best = max(best, row[y] + 1 + backward[x][y])
+            lengths[(level, v)] = best
+
+    return lengths
+
+def main():
+    try:
+        # Read input values for the number of cities (n) and the number of flights (m)
+        n, m = map(int, input().split())
+
+        city_indices = {}
+        road = [[0] * (n + 1) for _ in range(n + 1)]
+        routes = {}
+
+        # Read city names
+        for i in range(1, n + 1):
+            city_indices[input()] = i
+
+        # Read direct flight routes, keeping their input order
+        for i in range(1, m + 1):
+            input_line = input().split()
+            x, y = city_indices[input_line[0]], city_indices[input_line[1]]
+            road[x][y] = road[y][x] = 1
+            if x == 1:
+                road[0][y] = road[y][0] = 1
+            elif y == 1:
+                road[0][x] = road[x][0] = 1
+
+            route = (min(x, y), max(x, y))
+            if route not in routes:
+                routes[route] = (input_line[0], input_line[1])
+
+        forward = build_forward_table(n, road)
+
+        # Check if there is a valid solution, if not, print an error message and return
+        if forward[n][n] == -INF:
+            print("No Solution!")
+            return
+
+        tour_routes = find_tour_routes(n, road, forward)
+        backward = build_backward_table(n, road)
+        lengths = find_closure_lengths(n, road, forward, backward, tour_routes)
+
+        # Print the value of the optimal travel route
+        print(forward[n][n])
+
+        # Cancelling a route outside of the optimal travel route leaves it unchanged
+        ranked = sorted(routes, key=lambda route: lengths.get(route, forward[n][n]))
+
+        for route in ranked:
+            city1, city2 = routes[route]
+            length = lengths.get(route, forward[n][n])
+            print(f"{city1} {city2} {'No Solution!' if length == -INF else length}")
+
+    except ValueError:
+        print("Invalid input. Please enter valid integers for the number of cities and flights.")
+    except KeyError:
+        print("Invalid city name. Please enter valid city names.")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import subprocess
 
-def run_program_with_input(input_str):
+def run_program_with_input(input_str, program="process_dp.py"):
     # Run the Python program using subprocess
-    process = subprocess.Popen(["python", "process_dp.py"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    process = subprocess.Popen(["python", program], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
 
     # Write the input to the program's standard input
     process.stdin.write(input_str)